@@ -30,17 +30,22 @@ class Arecorder(Aserver):
     [Asig(''): ... x ... @ 44100Hz = ...
     """
 
+    buffer_seconds = 10  # initial recording buffer capacity in seconds of audio
+
     def __init__(self, sr=44100, bs=256, device=None, channels=None, backend=None, **kwargs):
-        super().__init__(sr=sr, bs=bs, device=device, 
+        super().__init__(sr=sr, bs=bs, device=device,
                          backend=backend, **kwargs)
-        self.record_buffer = []
         self.recordings = []  # store recorded Asigs, time stamp in label
+        self._rec_buf = None  # preallocated recording buffer filled by the callback
+        self._rec_len = 0  # number of frames recorded so far
+        self._read_idx = 0  # first frame not yet consumed by drain_into
+        self._overflow = []  # blocks parked by the callback when _rec_buf is full
         self._recording = False
         self._record_all = True
-        self.gains = np.ones(self.channels)
         self.tracks = slice(None)
         self._device = device or self.backend.get_default_input_device_info()['index']
         self.channels = channels or self.backend.get_device_info_by_index(self._device)['maxInputChannels']
+        self.gains = np.ones(self.channels)
 
     def set_tracks(self, tracks, gains):
         """Define the number of track to be recorded and their gains.
@@ -75,45 +80,178 @@ class Arecorder(Aserver):
         self.boot_time = time.time()
         self.block_time = self.boot_time
         # self.block_cnt = 0
-        self.record_buffer = []
+        self._rec_len = 0
+        self._read_idx = 0
+        self._overflow.clear()
         self._recording = False
+        # Both backends deliver exactly bs frames per callback, so the block
+        # view's shape and dtype are fixed and can be cached here.
+        self._block_shape = (self.bs, self.channels)
+        self._block_dtype = np.dtype(self.backend.dtype)
         self.stream = self.backend.open(rate=self.sr, channels=self.channels, frames_per_buffer=self.bs,
                                         input_device_index=self.device, output_flag=False,
                                         input_flag=True, stream_callback=self._recorder_callback)
         _LOGGER.info("Server Booted")
         return self
 
+    def _allocate_buffer(self):
+        """Preallocate the recording buffer the callback writes into.
+
+        The capacity is rounded up to a power-of-two multiple of the block
+        size covering at least buffer_seconds of audio. Allocation happens
+        on the user thread, so the audio callback never has to allocate
+        a fresh array per block.
+        """
+        n_tracks = self.channels if isinstance(self.tracks, slice) else len(self.tracks)
+        n_blocks = 1
+        while n_blocks * self.bs < self.buffer_seconds * self.sr:
+            n_blocks *= 2
+        self._rec_buf = np.zeros((n_blocks * self.bs, n_tracks), dtype=self.backend.dtype)
+        self._rec_len = 0
+        self._read_idx = 0
+        self._overflow.clear()
+
+    def _grow_buffer(self):
+        """Double the recording buffer, keeping the recorded data.
+
+        Growth is geometric, so the copy cost stays amortized O(1) per
+        recorded block.
+        """
+        grown = np.zeros((2 * self._rec_buf.shape[0], self._rec_buf.shape[1]),
+                         dtype=self._rec_buf.dtype)
+        np.copyto(grown[:self._rec_len], self._rec_buf[:self._rec_len])
+        self._rec_buf = grown
+
+    def _consolidate_overflow(self):
+        """Absorb blocks the callback parked in the overflow list.
+
+        Runs on the user thread. While the overflow list is non-empty the
+        callback appends to it and never touches the contiguous buffer, so
+        growing and refilling the buffer here cannot race with the audio
+        thread. Only the blocks present on entry are absorbed; anything the
+        callback appends meanwhile is picked up by the next call.
+        """
+        n_blocks = len(self._overflow)
+        if n_blocks == 0:
+            return
+        needed = self._rec_len + n_blocks * self.bs
+        while self._rec_buf.shape[0] < needed:
+            self._grow_buffer()
+        pos = self._rec_len
+        for block in self._overflow[:n_blocks]:
+            self._rec_buf[pos:pos + len(block)] = block
+            pos += len(block)
+        self._rec_len = pos
+        del self._overflow[:n_blocks]
+
     def _recorder_callback(self, in_data, frame_count, time_info, flag):
         """Callback function during streaming. """
         # self.block_cnt += 1
         if self._recording:
-            sigar = np.frombuffer(in_data, dtype=self.backend.dtype)
-            # (chunk length, chns)
-            data_float = np.reshape(sigar, (len(sigar) // self.channels, self.channels))
-            data_float = data_float[:, self.tracks] * self.gains  # apply channel selection and gains.
-            # if not self._record_all
-            self.record_buffer.append(data_float)
+            # (bs, chns), a zero-copy view of the input buffer built from
+            # the shape and dtype cached at boot time.
+            data_float = np.ndarray(self._block_shape, dtype=self._block_dtype, buffer=in_data)
+            # The overflow check comes before any read of the contiguous
+            # buffer: the user thread only rewrites _rec_buf and _rec_len
+            # while the overflow list is non-empty, so an empty list
+            # guarantees both are stable for the rest of this callback.
+            if self._overflow:
+                self._overflow.append(data_float[:, self.tracks] * self.gains)
+            else:
+                end = self._rec_len + len(data_float)
+                if end > self._rec_buf.shape[0]:
+                    # Buffer full: park the block in the overflow list
+                    # instead of growing here, which would copy the whole
+                    # take inside one callback budget. The user thread
+                    # consolidates in record(), drain_into() and stop();
+                    # later blocks follow into the list to preserve order.
+                    self._overflow.append(data_float[:, self.tracks] * self.gains)
+                else:
+                    # Apply channel selection and gains, writing straight
+                    # into the recording buffer so the callback allocates
+                    # nothing beyond the overflow path.
+                    np.multiply(data_float[:, self.tracks], self.gains,
+                                out=self._rec_buf[self._rec_len:end])
+                    self._rec_len = end
             # E = 10 * np.log10(np.mean(data_float ** 2)) # energy in dB
             # os.write(1, f"\r{E}    | {self.block_cnt}".encode())
         return None, pyaudio.paContinue
 
     def record(self):
         """Activate recording"""
+        n_tracks = self.channels if isinstance(self.tracks, slice) else len(self.tracks)
+        if self._rec_buf is None or self._rec_buf.shape[1] != n_tracks:
+            self._allocate_buffer()
+        # Grow here, on the user thread, so a resumed recording does not
+        # overflow immediately.
+        self._consolidate_overflow()
+        while self._rec_buf.shape[0] - self._rec_len < self.buffer_seconds * self.sr:
+            self._grow_buffer()
         self._recording = True
 
+    def drain_into(self, out):
+        """Copy buffered frames into a caller-supplied array and consume them.
+
+        This allows streaming a recording to disk without the Asig round
+        trip of stop(): the caller keeps one preallocated array and drains
+        into it periodically, so the steady state allocates nothing.
+
+        Safe to call while recording: the buffer reference and the write
+        position are snapshotted once, the callback only ever appends past
+        that snapshot, and consumed frames are tracked with a read offset
+        instead of compacting the buffer under the audio thread. The space
+        taken by consumed frames is reclaimed when stop() resets the
+        buffer.
+
+        Parameters
+        ----------
+        out : numpy.ndarray
+            Target array of shape (frames, tracks), or 1-D for a single
+            track. Up to len(out) frames are written to out[:n].
+
+        Returns
+        -------
+        int
+            The number of frames written.
+        """
+        self._consolidate_overflow()
+        # Snapshot the write position before the buffer reference: a
+        # concurrent grow reassigns _rec_buf first and raises _rec_len
+        # afterwards, so reading in this order keeps end <= len(buf) and
+        # the slice below always covers the full n frames.
+        end = self._rec_len
+        buf = self._rec_buf
+        n = min(len(out), end - self._read_idx)
+        if n > 0:
+            target = out[:n].reshape(n, buf.shape[1])
+            np.copyto(target, buf[self._read_idx:self._read_idx + n])
+            self._read_idx += n
+        return n
+
     def pause(self):
-        """Pause the recording, but the record_buffer remains"""
+        """Pause the recording, but the recorded data remains buffered"""
         self._recording = False
 
     def stop(self):
-        """Stop recording, then stores the data from record_buffer into recordings"""
+        """Stop recording, then stores the buffered data into recordings"""
         self._recording = False
-        if len(self.record_buffer) > 0:
-            sig = np.squeeze(np.vstack(self.record_buffer))
+        self._consolidate_overflow()
+        start = self._read_idx  # skip frames already consumed by drain_into
+        if self._rec_len > start:
+            # The recording is already one contiguous array, so wrapping it
+            # into an Asig is a single slice copy. For mono, copy the single
+            # column so the Asig is 1-D without a squeeze pass.
+            if self._rec_buf.shape[1] == 1:
+                sig = self._rec_buf[start:self._rec_len, 0].copy()
+            else:
+                sig = self._rec_buf[start:self._rec_len].copy()
+            self._rec_len = 0
+            self._read_idx = 0
             self.recordings.append(Asig(sig, self.sr, label=""))
-            self.record_buffer = []
         else:
-            _LOGGER.info(" Stopped. There is no recording in the record_buffer")
+            self._rec_len = 0
+            self._read_idx = 0
+            _LOGGER.info(" Stopped. There is no recording buffered")
 
     def __repr__(self):
         state = False
@@ -30,6 +30,10 @@ class Asig:
     ----------
     sig : numpy.array
         Array for the audio signal. Can be mono or multichannel.
+        The constructor always copies into a fresh C-contiguous float32
+        array, so sig is safe to hand to SIMD-friendly consumers and
+        strided or read-only inputs (e.g. np.broadcast_to views) never
+        leak through.
     sr : int
         Sampling rate
     label : str
@@ -7,9 +7,12 @@ meaning that the original audio signal is not modified and changes can be undone
 
 from typing import Type
 from abc import ABC, abstractmethod
+import functools
+import hashlib
 import json
 import binascii
 from amfm_decompy import basic_tools, pYAAPT
+import numba
 import numpy as np
 import matplotlib.pyplot as plt
 import librosa
@@ -17,10 +20,149 @@ import pytsmod as tsm
 import scipy.ndimage
 import scipy.io.wavfile
 import scipy.interpolate
+import scipy.signal
 from pya.asig import Asig
 
 
 AVERAGE_VIBRATO_RATE = 5  # Hz
+PITCH_DETECTION_SR = 8000  # Hz, ample headroom for YAAPT's f0_max of 600 Hz
+_SEMITONE_RATIO_MINUS_ONE = 2.0 ** (1.0 / 12.0) - 1.0
+
+
+@functools.lru_cache(maxsize=16)
+def _gauss_kernel(sigma: float, truncate: float = 4.0) -> np.ndarray:
+    """Returns the normalized 1-D gaussian kernel for the given sigma.
+
+    The kernel only depends on sigma, which is constant for a fixed pitch
+    sample rate, so it is memoized instead of being rebuilt on every
+    smoothing pass.
+
+    Parameters
+    ----------
+    sigma : float
+        The standard deviation of the gaussian, in samples.
+    truncate : float
+        Truncate the kernel at this many standard deviations.
+
+    Returns
+    -------
+    np.ndarray
+        The kernel, normalized to sum to 1.
+    """
+
+    radius = int(truncate * sigma + 0.5)
+    x = np.arange(-radius, radius + 1)
+    kernel = np.exp(-(x * x) / (2 * sigma * sigma))
+    return kernel / kernel.sum()
+
+
+@numba.njit(cache=True)
+def _scan_event_ranges(
+    pitch: np.ndarray,
+    pitch_smoothed: np.ndarray,
+    max_vibrato_extent: float,
+    max_vibrato_inaccuracy: float,
+    min_event_frames: float,
+) -> np.ndarray:
+    """Scans the pitch for event ranges, in pitch samples.
+
+    This is the hot loop of Cache._guess_events, compiled with numba.
+    The semitone conversions are therefore inlined in closed form
+    instead of calling librosa.
+
+    Parameters
+    ----------
+    pitch : np.ndarray
+        The pitch of the audio signal.
+    pitch_smoothed : np.ndarray
+        The gaussian-smoothed pitch of the audio signal.
+    max_vibrato_extent : float
+        The maximum difference between the average pitch of a event
+        to each pitch in the event, in cents.
+    max_vibrato_inaccuracy : float
+        A factor (between 0 and 1) that determines how accurate
+        the pitch of a event has to be within the event.
+    min_event_frames : float
+        The minimum length of a event, in pitch samples.
+
+    Returns
+    -------
+    np.ndarray
+        The event ranges, as an (n, 2) array of (start, end) pairs.
+    """
+
+    ranges = np.empty((len(pitch), 2), dtype=np.int64)
+    n_ranges = 0
+    start = 0  # Inclusive
+    end = 0  # Exclusive
+
+    # Running sum and extrema of the (smoothed) pitch in the current event,
+    # so the mean and both deviation tests are O(1) per sample.
+    run_sum = 0.0
+    run_min = np.inf
+    run_max = -np.inf
+    smoothed_min = np.inf
+    smoothed_max = -np.inf
+
+    for i, current_pitch in enumerate(pitch):
+        # Extend event by one sample.
+        end = i
+
+        end_event = False
+
+        # If the pitch is 0, end the current event.
+        if current_pitch == 0:
+            end_event = True
+        else:
+            run_sum += current_pitch
+            run_min = min(run_min, current_pitch)
+            run_max = max(run_max, current_pitch)
+            smoothed_min = min(smoothed_min, pitch_smoothed[i])
+            smoothed_max = max(smoothed_max, pitch_smoothed[i])
+
+            # Calculate what the average pitch would be
+            # if we added the current sample to the event.
+            new_avg = run_sum / (end + 1 - start)
+            # Hz difference between avg and one semitone higher
+            semitone_freq_delta = new_avg * _SEMITONE_RATIO_MINUS_ONE
+            max_freq_deviation = semitone_freq_delta * (
+                max_vibrato_extent / 100
+            )  # Max deviation in Hz
+
+            # If adding the current sample to the event would cause the pitch difference
+            # between the average pitch and any pitch in the event to be above the max,
+            # end the current event and start a new one.
+            if max(run_max - new_avg, new_avg - run_min) > max_freq_deviation:
+                end_event = True
+            # We end the event if the average pitch is too far away
+            # from the gaussian-smoothed pitch.
+            elif (
+                max(smoothed_max - new_avg, new_avg - smoothed_min)
+                > max_freq_deviation * max_vibrato_inaccuracy
+            ):
+                end_event = True
+            # If we have reached the end of the signal, end the current event
+            elif i == len(pitch) - 1:
+                end_event = True
+
+        if end_event:
+            # If the event is long enough, add it to the list of events before ending it
+            if end - start > min_event_frames:
+                ranges[n_ranges, 0] = start
+                ranges[n_ranges, 1] = end
+                n_ranges += 1
+
+            start = i
+
+            # The next event starts at the current sample,
+            # so the running values restart from it as well.
+            run_sum = current_pitch
+            run_min = current_pitch
+            run_max = current_pitch
+            smoothed_min = pitch_smoothed[i]
+            smoothed_max = pitch_smoothed[i]
+
+    return ranges[:n_ranges]
 
 
 class Esig:
@@ -748,24 +890,76 @@ class Cache:
         """
 
         self.esig = esig  # Store the esig object
+        self._pitch_cache = {}  # Memoized YAAPT results, keyed by signal content
         self.asig = Asig(
-            np.copy(esig.asig.sig), esig.asig.sr
-        )  # The current version of the audio signal
-        (
-            pitch,
-            pitch_sr,
-            frame_size,
-            frame_jump,
-        ) = self._recalculate(
-            0, len(self.asig.sig)
-        )  # Calculate the pitch
-        self.pitch = pitch  # The current version of the pitch
-        self.pitch_sr = pitch_sr  # The sample rate of the pitch
-        self.frame_size = frame_size  # The current frame size
-        self.frame_jump = frame_jump  # The current frame jump
-
-        # Calculate events
-        self.events = self._guess_events(self.pitch, self.pitch_sr)
+            esig.asig.sig, esig.asig.sr
+        )  # The current version of the audio signal (Asig copies the signal)
+
+        # Pitch tracking is by far the most expensive part (YAAPT), so it is
+        # deferred until a caller first reads the pitch or the events.
+        # Users who only construct the object never pay for it.
+        self._pitch = None  # The current version of the pitch
+        self._pitch_sr = None  # The sample rate of the pitch
+        self._frame_size = None  # The current frame size
+        self._frame_jump = None  # The current frame jump
+        self._events = None  # The current events
+
+    def _ensure_pitch(self) -> None:
+        """Calculates the pitch of the current signal, if not done yet."""
+
+        if self._pitch is None:
+            (
+                self._pitch,
+                self._pitch_sr,
+                self._frame_size,
+                self._frame_jump,
+            ) = self._recalculate(0, len(self.asig.sig))
+
+    @property
+    def pitch(self) -> np.ndarray:
+        self._ensure_pitch()
+        return self._pitch
+
+    @pitch.setter
+    def pitch(self, value: np.ndarray) -> None:
+        self._pitch = value
+
+    @property
+    def pitch_sr(self) -> float:
+        self._ensure_pitch()
+        return self._pitch_sr
+
+    @pitch_sr.setter
+    def pitch_sr(self, value: float) -> None:
+        self._pitch_sr = value
+
+    @property
+    def frame_size(self) -> int:
+        self._ensure_pitch()
+        return self._frame_size
+
+    @frame_size.setter
+    def frame_size(self, value: int) -> None:
+        self._frame_size = value
+
+    @property
+    def frame_jump(self) -> int:
+        self._ensure_pitch()
+        return self._frame_jump
+
+    @frame_jump.setter
+    def frame_jump(self, value: int) -> None:
+        self._frame_jump = value
+
+    @property
+    def events(self) -> list:
+        if self._events is None:
+            self._events = self._guess_events(self.pitch, self.pitch_sr)
+        return self._events
+
+    @events.setter
+    def events(self, value: list) -> None:
+        self._events = value
 
     def apply(self, edit: Type["Edit"]) -> None:
         """Applies the given edit to the cache.
@@ -777,6 +971,14 @@ class Cache:
             The edit to apply.
         """
 
+        # Edits mutate the signal and then compensate pitch and events for
+        # that mutation, so both have to be materialized from the pre-edit
+        # signal first. Deferring past this point would recalculate them
+        # from the already-edited signal and double-apply the compensation.
+        self._ensure_pitch()
+        if self._events is None:
+            self._events = self._guess_events(self._pitch, self._pitch_sr)
+
         edit.apply(self)
 
     def reapply(self) -> None:
@@ -784,17 +986,15 @@ class Cache:
         This applies all edits on top of the original asig and pitch.
         """
 
-        # Copy the original asig from esig
-        self.asig = Asig(np.copy(self.esig.asig.sig), self.esig.asig.sr)
+        # Copy the original asig from esig (Asig copies the signal)
+        self.asig = Asig(self.esig.asig.sig, self.esig.asig.sr)
 
-        # Calculate pitch and events
-        (
-            self.pitch,
-            self.pitch_sr,
-            self.frame_size,
-            self.frame_jump,
-        ) = self._recalculate(0, len(self.asig.sig))
-        self.events = self._guess_events(self.pitch, self.pitch_sr)
+        # Invalidate pitch and events; they are recalculated on first access.
+        self._pitch = None
+        self._pitch_sr = None
+        self._frame_size = None
+        self._frame_jump = None
+        self._events = None
 
         # Apply all edits
         for edit in self.esig.edits:
@@ -842,7 +1042,7 @@ class Cache:
             np.linspace(0, len(edited_pitch), target_length),
             np.arange(len(edited_pitch)),
             edited_pitch,
-        )
+        ).astype(np.float32)  # np.interp upcasts to float64
 
         # Replace the edited part of the pitch
         self.pitch = np.concatenate(
@@ -881,10 +1081,10 @@ class Cache:
             pitch, frame_size, frame_jump = self._guess_pitch_yaapt(
                 edited_part, self.asig.sr
             )
-            length = (
-                len(edited_part) / self.asig.sr
-            )  # Length of the audio signal (in seconds)
-            pitch_sr = len(pitch) / length  # Pitch sampling rate
+            # Pitch sampling rate. shape[0] counts frames, so this stays
+            # correct for multi-channel signals.
+            n_frames = edited_part.shape[0]
+            pitch_sr = len(pitch) * self.asig.sr / n_frames
         else:
             raise ValueError("Invalid algorithm")
 
@@ -908,8 +1108,30 @@ class Cache:
             The pitch, frame size, and frame jump of the pitch.
         """
 
-        # Create a SignalObj
+        # YAAPT is by far the most expensive step of an edit, and reapply()
+        # runs it once per edit on identical intermediate signals.
+        # Memoize the result by a content hash of the signal,
+        # which is cheap compared to YAAPT itself.
+        key = (
+            hashlib.blake2b(sig.tobytes(), digest_size=8).digest(),
+            sample_rate,
+        )
+        cached = self._pitch_cache.get(key)
+        if cached is not None:
+            return cached
+
         mono = librosa.to_mono(sig.T)
+
+        # YAAPT only tracks pitches up to f0_max, so typical audio rates are
+        # heavily oversampled for the task. Decimating towards
+        # PITCH_DETECTION_SR before running YAAPT cuts its cost accordingly.
+        # The frame sizes are scaled back to the original sample rate below.
+        factor = max(1, int(sample_rate // PITCH_DETECTION_SR))
+        if factor > 1:
+            mono = scipy.signal.resample_poly(mono, up=1, down=factor)
+            sample_rate = sample_rate / factor
+
+        # Create a SignalObj
         signal = basic_tools.SignalObj(mono, sample_rate)
 
         # Apply YAAPT
@@ -917,7 +1139,15 @@ class Cache:
             signal, frame_length=30, tda_frame_length=40, f0_min=60, f0_max=600
         )
 
-        return pitch_guess.samp_values, pitch_guess.frame_size, pitch_guess.frame_jump
+        # float32 is ample for Hz-resolution pitch and halves the memory
+        # traffic of the event scan.
+        result = (
+            pitch_guess.samp_values.astype(np.float32),
+            pitch_guess.frame_size * factor,
+            pitch_guess.frame_jump * factor,
+        )
+        self._pitch_cache[key] = result
+        return result
 
     def _guess_events(self, pitch: np.ndarray, pitch_sr: float) -> list:
         """Guesses the events from the pitch.
@@ -936,66 +1166,31 @@ class Cache:
             This list can be incomplete, e.g. parts of the audio signal have no event assigned.
         """
 
+        # The smoothing is translation-invariant, so we filter the pitch
+        # signal once and slice into it, instead of re-filtering the growing
+        # event slice for every sample. Each voiced (non-zero) run is
+        # filtered independently, so the zeros of unvoiced regions are not
+        # smeared into neighbouring events.
+        sigma = pitch_sr / (AVERAGE_VIBRATO_RATE * 2)
+        kernel = _gauss_kernel(sigma)
+        pitch_smoothed = np.zeros_like(pitch)
+        voiced = np.concatenate(([0], (pitch != 0).astype(np.int8), [0]))
+        run_bounds = np.flatnonzero(np.diff(voiced))
+        for run_start, run_end in zip(run_bounds[::2], run_bounds[1::2]):
+            pitch_smoothed[run_start:run_end] = scipy.ndimage.convolve1d(
+                pitch[run_start:run_end], kernel, mode="reflect"
+            )
+
         # We first define a event as a range of samples,
         # where the pitch is not too far away from the mean pitch of the range.
-        ranges = []
-        start = 0  # Inclusive
-        end = 0  # Exclusive
-        for i, current_pitch in enumerate(pitch):
-            # Extend event by one sample.
-            end = i
-
-            end_event = False
-
-            # If the pitch is 0, end the current event.
-            if current_pitch == 0:
-                end_event = True
-            else:
-                # Get the pitches in the current event.
-                pitches = pitch[start:end]
-                new_pitches = np.append(pitches, current_pitch)
-
-                sigma = pitch_sr / (AVERAGE_VIBRATO_RATE * 2)
-                new_pitches_gaussian = scipy.ndimage.gaussian_filter1d(
-                    new_pitches, sigma
-                )
-
-                # Calculate what the average pitch would be
-                # if we added the current sample to the event.
-                new_avg = np.mean(new_pitches)
-                new_avg_midi = librosa.hz_to_midi(new_avg)
-                semitone_freq_delta = (
-                    librosa.midi_to_hz(new_avg_midi + 1) - new_avg
-                )  # Hz difference between avg and one semitone higher
-                max_freq_deviation = semitone_freq_delta * (
-                    self.esig.max_vibrato_extent / 100
-                )  # Max deviation in Hz
-
-                # If adding the current sample to the event would cause the pitch difference
-                # between the average pitch and any pitch in the event to be above the max,
-                # end the current event and start a new one.
-                if any(
-                    abs(pitch - new_avg) > max_freq_deviation for pitch in new_pitches
-                ):
-                    end_event = True
-                # We end the event if the average pitch is too far away
-                # from the gaussian-smoothed pitch.
-                elif any(
-                    abs(pitch_gaussian - new_avg)
-                    > max_freq_deviation * self.esig.max_vibrato_inaccuracy
-                    for pitch_gaussian in new_pitches_gaussian
-                ):
-                    end_event = True
-                # If we have reached the end of the signal, end the current event
-                elif i == len(pitch) - 1:
-                    end_event = True
-
-            if end_event:
-                # If the event is long enough, add it to the list of events before ending it
-                if end - start > self.esig.min_event_length * pitch_sr:
-                    ranges.append((start, end))
-
-                start = i
+        # The scan itself is compiled with numba, see _scan_event_ranges.
+        ranges = _scan_event_ranges(
+            pitch,
+            pitch_smoothed,
+            float(self.esig.max_vibrato_extent),
+            float(self.esig.max_vibrato_inaccuracy),
+            self.esig.min_event_length * pitch_sr,
+        )
 
         # Create the events
         events = []
@@ -1095,15 +1290,13 @@ class PitchChange(Edit):
             end = int(self.end * factor)
 
             # Calculate the new pitch contour,
-            # i.e. the pitch contour shifted by the shift factor for the given range
-            changed_pitch = np.copy(cache.pitch)
-            for i in range(start, end):
-                # Get current pitch and adapt by the change factor
-                current_pitch = changed_pitch[i]
-                current_pitch = librosa.hz_to_midi(current_pitch)
-                current_pitch += self.change
-                current_pitch = librosa.midi_to_hz(current_pitch)
-                changed_pitch[i] = current_pitch
+            # i.e. the pitch contour shifted by the shift factor for the given range.
+            # float32 is plenty for a Hz contour and halves the bytes moved,
+            # and the whole range is shifted in one vectorized pass.
+            changed_pitch = cache.pitch.astype(np.float32)
+            changed_pitch[start:end] = librosa.midi_to_hz(
+                librosa.hz_to_midi(changed_pitch[start:end]) + self.change
+            )
 
             # Apply the pitch change
             cache.asig.sig = tsm.tdpsola(
@@ -1237,7 +1430,9 @@ class LengthChange(Edit):
         pitch_after = cache.pitch[end_pitch:]
         edit_length_pitch = int(len(edit) * (cache.pitch_sr / cache.asig.sr))
         cache.pitch = np.concatenate(
-            (pitch_before, [0] * edit_length_pitch, pitch_after)
+            (pitch_before,
+             np.zeros(edit_length_pitch, dtype=pitch_before.dtype),
+             pitch_after)
         )
 
         # Recalculate the pitch
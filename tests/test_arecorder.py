@@ -148,6 +148,31 @@ class TestArecorderBase(TestCase):
             with self.assertRaises(ValueError):
                 s.boot()
 
+    @pytest.mark.xfail(reason="Test may get affected by PortAudio bug or potential unsuitable audio device.")
+    def test_drain_into(self):
+        import numpy as np
+        ar = Arecorder(backend=self.backend).boot()
+        ar.record()
+        time.sleep(0.3)
+        n_tracks = ar._rec_buf.shape[1]
+        out = np.zeros((ar.sr, n_tracks), dtype=ar.backend.dtype)
+        drained = ar.drain_into(out)  # drain while the recording is live
+        self.assertGreater(drained, 0)
+        time.sleep(0.3)
+        ar.stop()  # the undrained rest becomes a recording
+        self.assertEqual(1, len(ar.recordings))
+        # drained frames are consumed, not duplicated into the recording
+        total = drained + ar.recordings[-1].sig.shape[0]
+        self.assertGreater(total, drained)
+        ar.record()
+        time.sleep(0.3)
+        ar.pause()
+        while ar.drain_into(out) > 0:
+            pass
+        ar.stop()  # fully drained, so no recording is appended
+        self.assertEqual(1, len(ar.recordings))
+        ar.quit()
+
     @pytest.mark.xfail(reason="Some devices may not have inputs")
     def test_default_channels(self):
         if self.backend:
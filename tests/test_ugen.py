@@ -16,6 +16,7 @@ class TestUgen(TestCase):
         )
         self.assertEqual(44100 // 2, sine.sr)
         self.assertEqual(0.5, np.max(sine.sig))
+        self.assertEqual(np.float32, sine.sig.dtype)
         self.assertEqual((22, 2), sine.sig.shape)
         sine = Ugen().sine(
             freq=44100 / 16, amp=0.5, n_rows=400, sr=44100 // 2, channels=2
@@ -34,9 +35,22 @@ class TestUgen(TestCase):
         self.assertEqual(0.5, np.max(cos.sig))
         self.assertEqual((44, 2), cos.sig.shape)
 
+    def test_sincos(self):
+        sine, cos = Ugen().sincos(
+            freq=44100 / 16, amp=0.5, n_rows=44, sr=44100 // 2, channels=2
+        )
+        self.assertEqual(44100 // 2, sine.sr)
+        self.assertEqual((44, 2), sine.sig.shape)
+        self.assertEqual((44, 2), cos.sig.shape)
+        sine_ref = Ugen().sine(freq=44100 / 16, amp=0.5, n_rows=44, sr=44100 // 2, channels=2)
+        cos_ref = Ugen().cos(freq=44100 / 16, amp=0.5, n_rows=44, sr=44100 // 2, channels=2)
+        self.assertTrue(np.array_equal(sine_ref.sig, sine.sig))
+        self.assertTrue(np.array_equal(cos_ref.sig, cos.sig))
+
     def test_square(self):
         square = Ugen().square(freq=200, amp=0.5, dur=1.0, sr=44100 // 2, channels=2)
         self.assertEqual(44100 // 2, square.sr)
+        self.assertEqual(np.float32, square.sig.dtype)
         self.assertAlmostEqual(0.5, np.max(square.sig), places=5)
         self.assertEqual((44100 // 2, 2), square.sig.shape)
 